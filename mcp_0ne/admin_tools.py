@@ -11,110 +11,215 @@ These tools let MCP clients manage backends at runtime:
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+import orjson
 
 from .registry import BackendRegistry
 
+logger = logging.getLogger("mcp_0ne.admin_tools")
+
 ADMIN_PREFIX = "0ne"
 ADMIN_SEP = "__"
+_ADMIN_FULL_PREFIX = f"{ADMIN_PREFIX}{ADMIN_SEP}"
+_ADMIN_FULL_PREFIX_LEN = len(_ADMIN_FULL_PREFIX)
 
 
-def _tool_name(name: str) -> str:
-    return f"{ADMIN_PREFIX}{ADMIN_SEP}{name}"
+def _dumps(obj: Any) -> str:
+    """Serialize an admin tool result as indented JSON text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
-def get_admin_tool_definitions() -> list[dict[str, Any]]:
-    """Return MCP tool definitions for all admin tools."""
-    return [
-        {
-            "name": _tool_name("discover"),
-            "description": "List all registered backends with their state, tool count, and description.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
+def _tool_name(name: str) -> str:
+    return _ADMIN_FULL_PREFIX + name
+
+
+# Static tool definitions, built once at import time.
+_ADMIN_TOOL_DEFS: list[dict[str, Any]] = [
+    {
+        "name": _tool_name("discover"),
+        "description": "List all registered backends with their state, tool count, and description.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("health"),
-            "description": "Run health checks on all connected backends. Returns latency and status for each.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
+    },
+    {
+        "name": _tool_name("health"),
+        "description": "Run health checks on all connected backends. Returns latency and status for each.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("add"),
-            "description": "Register a new backend MCP server. Connects and enumerates tools immediately.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "Unique backend identifier"},
-                    "type": {"type": "string", "enum": ["http", "stdio"], "description": "Backend type"},
-                    "prefix": {"type": "string", "description": "Tool namespace prefix (must be unique)"},
-                    "url": {"type": "string", "description": "MCP endpoint URL (required for http type)"},
-                    "health_url": {"type": "string", "description": "Health check URL (optional, http only)"},
-                    "command": {"type": "string", "description": "Executable path (required for stdio type)"},
-                    "args": {"type": "array", "items": {"type": "string"}, "description": "Command arguments (stdio only)"},
-                    "env": {"type": "object", "description": "Environment variables (stdio only)"},
-                    "timeout": {"type": "number", "description": "Request timeout in seconds (default: 30)"},
-                    "description": {"type": "string", "description": "Human-readable description"},
-                    "enabled": {"type": "boolean", "description": "Whether to connect immediately (default: true)"},
-                },
-                "required": ["id", "type", "prefix"],
-                "additionalProperties": False,
+    },
+    {
+        "name": _tool_name("add"),
+        "description": "Register a new backend MCP server. Connects and enumerates tools immediately.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Unique backend identifier"},
+                "type": {"type": "string", "enum": ["http", "stdio"], "description": "Backend type"},
+                "prefix": {"type": "string", "description": "Tool namespace prefix (must be unique)"},
+                "url": {"type": "string", "description": "MCP endpoint URL (required for http type)"},
+                "health_url": {"type": "string", "description": "Health check URL (optional, http only)"},
+                "command": {"type": "string", "description": "Executable path (required for stdio type)"},
+                "args": {"type": "array", "items": {"type": "string"}, "description": "Command arguments (stdio only)"},
+                "env": {"type": "object", "description": "Environment variables (stdio only)"},
+                "timeout": {"type": "number", "description": "Request timeout in seconds (default: 30)"},
+                "description": {"type": "string", "description": "Human-readable description"},
+                "enabled": {"type": "boolean", "description": "Whether to connect immediately (default: true)"},
             },
+            "required": ["id", "type", "prefix"],
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("remove"),
-            "description": "Disconnect and unregister a backend. Removes from config.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "Backend ID to remove"},
-                },
-                "required": ["id"],
-                "additionalProperties": False,
+    },
+    {
+        "name": _tool_name("remove"),
+        "description": "Disconnect and unregister a backend. Removes from config.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Backend ID to remove"},
             },
+            "required": ["id"],
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("enable"),
-            "description": "Enable a disabled backend. Connects and enumerates tools.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "Backend ID to enable"},
-                },
-                "required": ["id"],
-                "additionalProperties": False,
+    },
+    {
+        "name": _tool_name("enable"),
+        "description": "Enable a disabled backend. Connects and enumerates tools.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Backend ID to enable"},
             },
+            "required": ["id"],
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("disable"),
-            "description": "Disable a backend without removing it. Disconnects and hides tools.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "Backend ID to disable"},
-                },
-                "required": ["id"],
-                "additionalProperties": False,
+    },
+    {
+        "name": _tool_name("disable"),
+        "description": "Disable a backend without removing it. Disconnects and hides tools.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Backend ID to disable"},
             },
+            "required": ["id"],
+            "additionalProperties": False,
         },
-        {
-            "name": _tool_name("refresh"),
-            "description": "Force reconnect and re-enumerate tools for one or all backends.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "Backend ID to refresh (omit for all)"},
-                },
-                "additionalProperties": False,
+    },
+    {
+        "name": _tool_name("refresh"),
+        "description": "Force reconnect and re-enumerate tools for one or all backends.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "Backend ID to refresh (omit for all)"},
             },
+            "additionalProperties": False,
         },
-    ]
+    },
+]
+
+
+def get_admin_tool_definitions() -> list[dict[str, Any]]:
+    """Return MCP tool definitions for all admin tools.
+
+    The returned list is shared across calls and must be treated as read-only.
+    """
+    return _ADMIN_TOOL_DEFS
+
+
+def _require_id(arguments: dict[str, Any]) -> str:
+    backend_id = arguments.get("id", "")
+    if not backend_id:
+        raise ValueError("'id' is required")
+    return backend_id
+
+
+async def _do_discover(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    backends = registry.list_backends()
+    return {"backends": backends, "count": len(backends)}
+
+
+async def _do_health(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    ids = [info["id"] for info in registry.list_backends()]
+    probes = await asyncio.gather(
+        *[_health_probe(registry, backend_id) for backend_id in ids],
+        return_exceptions=True,
+    )
+    return {
+        backend_id: {"ok": False, "error": str(probe)} if isinstance(probe, Exception) else probe
+        for backend_id, probe in zip(ids, probes)
+    }
+
+
+async def _health_probe(registry: BackendRegistry, backend_id: str) -> dict[str, Any]:
+    """Health check a single backend by ID."""
+    backend = registry.get_backend(backend_id)
+    if not backend:
+        return {"ok": False, "error": "not found"}
+    return await backend.health_check()
+
+
+async def _do_add(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    backend_id = _require_id(arguments)
+    prefix = arguments.get("prefix")
+    if not prefix:
+        raise ValueError("'prefix' is required")
+    backend_type = arguments.get("type", "")
+    if backend_type not in ("http", "stdio"):
+        raise ValueError("'type' must be 'http' or 'stdio'")
+    if backend_type == "http" and not arguments.get("url"):
+        raise ValueError("'url' is required for http backends")
+    if backend_type == "stdio" and not arguments.get("command"):
+        raise ValueError("'command' is required for stdio backends")
+
+    config = {
+        "type": backend_type,
+        "prefix": prefix,
+        "enabled": arguments.get("enabled", True),
+    }
+    # Copy optional fields
+    for key in ("url", "health_url", "command", "args", "env", "timeout", "description"):
+        if key in arguments:
+            config[key] = arguments[key]
+
+    return await registry.add_backend(backend_id, config)
+
+
+async def _do_remove(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    return await registry.remove_backend(_require_id(arguments))
+
+
+async def _do_enable(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    return await registry.enable_backend(_require_id(arguments))
+
+
+async def _do_disable(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    return await registry.disable_backend(_require_id(arguments))
+
+
+async def _do_refresh(arguments: dict[str, Any], registry: BackendRegistry) -> Any:
+    return await registry.refresh(arguments.get("id"))
+
+
+# action -> handler; handlers return the payload to serialize, or raise on failure
+_HANDLERS: dict[str, Callable[[dict[str, Any], BackendRegistry], Awaitable[Any]]] = {
+    "discover": _do_discover,
+    "health": _do_health,
+    "add": _do_add,
+    "remove": _do_remove,
+    "enable": _do_enable,
+    "disable": _do_disable,
+    "refresh": _do_refresh,
+}
 
 
 async def handle_admin_tool(
@@ -123,88 +228,27 @@ async def handle_admin_tool(
     registry: BackendRegistry,
 ) -> dict[str, Any] | None:
     """Handle an admin tool call. Returns None if not an admin tool."""
-    if not tool_name.startswith(f"{ADMIN_PREFIX}{ADMIN_SEP}"):
+    if not tool_name.startswith(_ADMIN_FULL_PREFIX):
         return None
 
-    action = tool_name[len(f"{ADMIN_PREFIX}{ADMIN_SEP}"):]
+    action = tool_name[_ADMIN_FULL_PREFIX_LEN:]
+    handler = _HANDLERS.get(action)
+    if handler is None:
+        return _error(f"Unknown admin action: {action}")
 
     try:
-        if action == "discover":
-            backends = registry.list_backends()
-            text = json.dumps({"backends": backends, "count": len(backends)}, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "health":
-            results = {}
-            for info in registry.list_backends():
-                backend = registry.get_backend(info["id"])
-                if backend:
-                    results[info["id"]] = await backend.health_check()
-                else:
-                    results[info["id"]] = {"ok": False, "error": "not found"}
-            text = json.dumps(results, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "add":
-            backend_id = arguments.get("id", "")
-            if not backend_id:
-                return _error("'id' is required")
-            backend_type = arguments.get("type", "")
-            if backend_type not in ("http", "stdio"):
-                return _error("'type' must be 'http' or 'stdio'")
-            if backend_type == "http" and not arguments.get("url"):
-                return _error("'url' is required for http backends")
-            if backend_type == "stdio" and not arguments.get("command"):
-                return _error("'command' is required for stdio backends")
-
-            config = {
-                "type": backend_type,
-                "prefix": arguments["prefix"],
-                "enabled": arguments.get("enabled", True),
-            }
-            # Copy optional fields
-            for key in ("url", "health_url", "command", "args", "env", "timeout", "description"):
-                if key in arguments:
-                    config[key] = arguments[key]
-
-            result = await registry.add_backend(backend_id, config)
-            text = json.dumps(result, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "remove":
-            backend_id = arguments.get("id", "")
-            if not backend_id:
-                return _error("'id' is required")
-            result = await registry.remove_backend(backend_id)
-            text = json.dumps(result, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "enable":
-            backend_id = arguments.get("id", "")
-            if not backend_id:
-                return _error("'id' is required")
-            result = await registry.enable_backend(backend_id)
-            text = json.dumps(result, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "disable":
-            backend_id = arguments.get("id", "")
-            if not backend_id:
-                return _error("'id' is required")
-            result = await registry.disable_backend(backend_id)
-            text = json.dumps(result, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        elif action == "refresh":
-            result = await registry.refresh(arguments.get("id"))
-            text = json.dumps(result, indent=2)
-            return {"content": [{"type": "text", "text": text}], "isError": False}
-
-        else:
-            return _error(f"Unknown admin action: {action}")
-
+        result = await handler(arguments, registry)
+    except ValueError as e:
+        # Invalid arguments or unknown backend — reported to the caller only
+        return _error(str(e))
     except Exception as e:
+        logger.exception(f"admin.{action} failed")
         return _error(str(e))
+    return _ok_text(_dumps(result))
+
+
+def _ok_text(text: str) -> dict[str, Any]:
+    return {"content": [{"type": "text", "text": text}], "isError": False}
 
 
 def _error(message: str) -> dict[str, Any]:
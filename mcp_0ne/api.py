@@ -37,6 +37,10 @@ class AddBackendRequest(BaseModel):
     enabled: bool = Field(True, description="Connect immediately")
 
 
+# Field names copied into the backend config by add_backend
+_ADD_FIELDS = tuple(AddBackendRequest.model_fields)
+
+
 class UpdateBackendRequest(BaseModel):
     """Request body for updating a backend."""
     enabled: bool | None = None
@@ -55,7 +59,7 @@ async def list_backends() -> dict[str, Any]:
 @router.post("/backends/{backend_id}")
 async def add_backend(backend_id: str, body: AddBackendRequest) -> dict[str, Any]:
     """Add a new backend."""
-    config = body.model_dump(exclude_none=True)
+    config = {k: v for k in _ADD_FIELDS if (v := getattr(body, k)) is not None}
     try:
         result = await _registry.add_backend(backend_id, config)
         return result
@@ -75,13 +79,11 @@ async def remove_backend(backend_id: str) -> dict[str, Any]:
 @router.patch("/backends/{backend_id}")
 async def update_backend(backend_id: str, body: UpdateBackendRequest) -> dict[str, Any]:
     """Update backend configuration."""
-    backend = _registry.get_backend(backend_id)
-    if not backend:
-        raise HTTPException(status_code=404, detail=f"Backend '{backend_id}' not found")
-
     updates = body.model_dump(exclude_none=True)
-    backend.config.update(updates)
-    _registry._persist()
+    try:
+        backend = _registry.update_backend_config(backend_id, updates)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
     return {"id": backend_id, "updated": list(updates.keys()), "config": backend.config}
 
@@ -9,7 +9,9 @@ from __future__ import annotations
 import enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
+
+import orjson
 
 
 class BackendState(enum.Enum):
@@ -20,7 +22,7 @@ class BackendState(enum.Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class BackendToolInfo:
     """Metadata for a single tool exposed by a backend."""
     original_name: str
@@ -30,11 +32,20 @@ class BackendToolInfo:
     backend_id: str
 
 
-@dataclass
+def intern_schema(schema: dict[str, Any], cache: dict[bytes, dict[str, Any]]) -> dict[str, Any]:
+    """Return the first schema in ``cache`` equal to ``schema``, adding it if new.
+
+    Lets tools with identical input schemas share a single dict.
+    """
+    return cache.setdefault(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), schema)
+
+
+@dataclass(slots=True)
 class BackendConnection(ABC):
     """Abstract base for a backend MCP connection.
 
-    Subclasses implement the transport-specific logic (HTTP or stdio).
+    Subclasses implement the transport-specific logic (HTTP or stdio)
+    and declare their own ``__slots__`` for any extra attributes.
     """
     id: str
     config: dict[str, Any]
@@ -42,7 +53,27 @@ class BackendConnection(ABC):
     separator: str = "__"
     state: BackendState = field(default=BackendState.DISCONNECTED, init=False)
     error_message: str | None = field(default=None, init=False)
-    _tools: list[BackendToolInfo] = field(default_factory=list, init=False)
+    _tools: tuple[BackendToolInfo, ...] = field(default=(), init=False)
+    # MCP tool dicts for the indexed tools, maintained by the registry
+    _tool_dicts: list[dict[str, Any]] = field(default_factory=list, init=False)
+    _description: str = field(default="", init=False)
+    _backend_type: str = field(default="unknown", init=False)
+    _enabled: bool = field(default=True, init=False)
+    _tool_prefix: str = field(default="", init=False)
+
+    def __post_init__(self) -> None:
+        # prefix and separator are fixed for the life of the connection
+        self._tool_prefix = self.prefix + self.separator
+        self.refresh_cached_config()
+
+    def refresh_cached_config(self) -> None:
+        """Re-read the config fields reported by status_dict().
+
+        Must be called after mutating ``config`` in place.
+        """
+        self._description = self.config.get("description", "")
+        self._backend_type = self.config.get("type", "unknown")
+        self._enabled = self.config.get("enabled", True)
 
     @abstractmethod
     async def connect(self) -> None:
@@ -55,8 +86,11 @@ class BackendConnection(ABC):
         ...
 
     @abstractmethod
-    async def list_tools(self) -> list[BackendToolInfo]:
-        """Enumerate tools from the backend. Returns namespaced tool infos."""
+    async def list_tools(self) -> Sequence[BackendToolInfo]:
+        """Enumerate tools from the backend. Returns namespaced tool infos.
+
+        The result is the backend's cached tuple and must not be mutated.
+        """
         ...
 
     @abstractmethod
@@ -74,29 +108,29 @@ class BackendConnection(ABC):
 
     def _namespace(self, tool_name: str) -> str:
         """Create namespaced tool name: {prefix}{separator}{tool_name}."""
-        return f"{self.prefix}{self.separator}{tool_name}"
+        return self._tool_prefix + tool_name
 
     @property
     def description(self) -> str:
-        return self.config.get("description", "")
+        return self._description
 
     @property
     def backend_type(self) -> str:
-        return self.config.get("type", "unknown")
+        return self._backend_type
 
     @property
     def enabled(self) -> bool:
-        return self.config.get("enabled", True)
+        return self._enabled
 
     def status_dict(self) -> dict[str, Any]:
         """Return status summary for discovery/health endpoints."""
         return {
             "id": self.id,
-            "type": self.backend_type,
+            "type": self._backend_type,
             "prefix": self.prefix,
             "state": self.state.value,
-            "enabled": self.enabled,
-            "description": self.description,
+            "enabled": self._enabled,
+            "description": self._description,
             "tool_count": len(self._tools),
             "error": self.error_message,
         }
@@ -6,52 +6,91 @@ via standard JSON-RPC 2.0 messages.
 
 from __future__ import annotations
 
+import itertools
 import logging
 import time
-from typing import Any
+from typing import Any, Sequence
 
 import httpx
+import orjson
 
-from .base import BackendConnection, BackendState, BackendToolInfo
+from .base import BackendConnection, BackendState, BackendToolInfo, intern_schema
 
 logger = logging.getLogger("mcp_0ne.backends.http")
 
+_HEALTH_TIMEOUT = 5.0
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Static JSON-RPC request bodies, encoded once
+_INITIALIZE_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": "init",
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-0ne", "version": "0.1.0"},
+    },
+})
+_LIST_TOOLS_BODY = orjson.dumps({"jsonrpc": "2.0", "id": "list-tools", "method": "tools/list", "params": {}})
+_HEALTH_BODY = orjson.dumps({"jsonrpc": "2.0", "id": "health", "method": "tools/list", "params": {}})
+
 
 class HttpBackend(BackendConnection):
     """Backend that connects to an HTTP MCP server via JSON-RPC 2.0."""
 
+    __slots__ = (
+        "_url",
+        "_health_url",
+        "_timeout",
+        "_initialized",
+        "_tools_cache_time_ns",
+        "_tool_cache_ttl_ns",
+        "_client",
+        "_request_ids",
+    )
+
     def __init__(self, id: str, config: dict[str, Any], separator: str = "__"):
         super().__init__(id=id, config=config, prefix=config["prefix"], separator=separator)
         self._url: str = config["url"]
         self._health_url: str | None = config.get("health_url")
         self._timeout: float = float(config.get("timeout", 30))
         self._initialized: bool = False
-        self._tools_cache_time: float = 0
-        self._tool_cache_ttl: float = float(config.get("tool_cache_ttl", 60))
+        self._tools_cache_time_ns: int = 0
+        self._tool_cache_ttl_ns: int = int(float(config.get("tool_cache_ttl", 60)) * 1_000_000_000)
+        self._client: httpx.AsyncClient | None = None
+        self._request_ids = itertools.count(1)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use.
+
+        The client is closed whenever the backend drops out of CONNECTED,
+        since shutdown only disconnects connected backends.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return self._client
+
+    async def _close_client(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def connect(self) -> None:
         """Initialize session with the HTTP MCP server."""
         self.state = BackendState.CONNECTING
         self.error_message = None
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    self._url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": "init",
-                        "method": "initialize",
-                        "params": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {},
-                            "clientInfo": {"name": "mcp-0ne", "version": "0.1.0"},
-                        },
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                if "error" in data:
-                    raise Exception(data["error"].get("message", "Initialize failed"))
+            resp = await self._get_client().post(
+                self._url, content=_INITIALIZE_BODY, headers=_JSON_HEADERS
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            if "error" in data:
+                raise Exception(data["error"].get("message", "Initialize failed"))
 
             self._initialized = True
             self.state = BackendState.CONNECTED
@@ -60,90 +99,90 @@ class HttpBackend(BackendConnection):
             self.state = BackendState.ERROR
             self.error_message = str(e)
             logger.error(f"[{self.id}] Failed to connect: {e}")
+            await self._close_client()
             raise
 
     async def disconnect(self) -> None:
-        """No persistent connection to close for HTTP."""
+        """Close the pooled HTTP client."""
+        await self._close_client()
         self.state = BackendState.DISCONNECTED
         self._initialized = False
-        self._tools = []
-        self._tools_cache_time = 0
+        self._tools = ()
+        self._tools_cache_time_ns = 0
         logger.info(f"[{self.id}] Disconnected")
 
-    async def list_tools(self) -> list[BackendToolInfo]:
+    async def list_tools(self) -> Sequence[BackendToolInfo]:
         """Fetch tools from the HTTP backend via tools/list."""
-        now = time.time()
-        if self._tools and (now - self._tools_cache_time) < self._tool_cache_ttl:
+        now = time.monotonic_ns()
+        if self._tools and (now - self._tools_cache_time_ns) < self._tool_cache_ttl_ns:
             return self._tools
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    self._url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": "list-tools",
-                        "method": "tools/list",
-                        "params": {},
-                    },
+            resp = await self._get_client().post(
+                self._url, content=_LIST_TOOLS_BODY, headers=_JSON_HEADERS
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+
+            if "error" in data:
+                raise Exception(data["error"].get("message", "tools/list failed"))
+
+            raw_tools = data.get("result", {}).get("tools", [])
+            pfx = self._tool_prefix
+            schemas: dict[bytes, dict[str, Any]] = {}
+            self._tools = tuple(
+                BackendToolInfo(
+                    original_name=name,
+                    namespaced_name=pfx + name,
+                    description=t.get("description", ""),
+                    input_schema=intern_schema(t.get("inputSchema", {}), schemas),
+                    backend_id=self.id,
                 )
-                resp.raise_for_status()
-                data = resp.json()
-
-                if "error" in data:
-                    raise Exception(data["error"].get("message", "tools/list failed"))
-
-                raw_tools = data.get("result", {}).get("tools", [])
-                self._tools = [
-                    BackendToolInfo(
-                        original_name=t.get("name", ""),
-                        namespaced_name=self._namespace(t.get("name", "")),
-                        description=t.get("description", ""),
-                        input_schema=t.get("inputSchema", {}),
-                        backend_id=self.id,
-                    )
-                    for t in raw_tools
-                ]
-                self._tools_cache_time = now
-                logger.info(f"[{self.id}] Enumerated {len(self._tools)} tools")
-                return self._tools
+                for t in raw_tools
+                for name in (t.get("name", ""),)
+            )
+            self._tools_cache_time_ns = now
+            logger.info(f"[{self.id}] Enumerated {len(self._tools)} tools")
+            return self._tools
 
         except Exception as e:
             self.state = BackendState.ERROR
             self.error_message = str(e)
             logger.error(f"[{self.id}] Failed to list tools: {e}")
+            await self._close_client()
             raise
 
     async def call_tool(self, original_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Call a tool on the HTTP backend."""
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    self._url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": f"call-{original_name}",
-                        "method": "tools/call",
-                        "params": {
-                            "name": original_name,
-                            "arguments": arguments,
-                        },
+            resp = await self._get_client().post(
+                self._url,
+                content=orjson.dumps({
+                    "jsonrpc": "2.0",
+                    "id": next(self._request_ids),
+                    "method": "tools/call",
+                    "params": {
+                        "name": original_name,
+                        "arguments": arguments,
                     },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+                }),
+                headers=_JSON_HEADERS,
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
-                if "error" in data:
-                    return {
-                        "content": [{"type": "text", "text": data["error"].get("message", "Tool call failed")}],
-                        "isError": True,
-                    }
+            if "error" in data:
+                return {
+                    "content": [{"type": "text", "text": data["error"].get("message", "Tool call failed")}],
+                    "isError": True,
+                }
 
-                return data.get("result", {"content": [], "isError": False})
+            return data.get("result", {"content": [], "isError": False})
 
         except httpx.ConnectError:
             self.state = BackendState.ERROR
             self.error_message = f"Cannot connect to {self._url}"
+            await self._close_client()
             return {
                 "content": [{"type": "text", "text": f"Backend '{self.id}' unreachable at {self._url}"}],
                 "isError": True,
@@ -156,29 +195,32 @@ class HttpBackend(BackendConnection):
 
     async def health_check(self) -> dict[str, Any]:
         """Check backend health via health URL or tools/list."""
-        start = time.time()
+        if self._client is not None:
+            return await self._probe(self._client)
+        # Not connected: use a throwaway client rather than opening the pool
+        async with httpx.AsyncClient() as client:
+            return await self._probe(client)
+
+    async def _probe(self, client: httpx.AsyncClient) -> dict[str, Any]:
+        start = time.monotonic_ns()
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                if self._health_url:
-                    resp = await client.get(self._health_url)
-                    resp.raise_for_status()
-                    latency_ms = round((time.time() - start) * 1000)
-                    return {"ok": True, "latency_ms": latency_ms, **resp.json()}
-                else:
-                    # Fall back to tools/list as health probe
-                    resp = await client.post(
-                        self._url,
-                        json={
-                            "jsonrpc": "2.0",
-                            "id": "health",
-                            "method": "tools/list",
-                            "params": {},
-                        },
-                    )
-                    resp.raise_for_status()
-                    latency_ms = round((time.time() - start) * 1000)
-                    return {"ok": True, "latency_ms": latency_ms}
+            if self._health_url:
+                resp = await client.get(self._health_url, timeout=_HEALTH_TIMEOUT)
+                resp.raise_for_status()
+                latency_ms = (time.monotonic_ns() - start) // 1_000_000
+                return {"ok": True, "latency_ms": latency_ms, **orjson.loads(resp.content)}
+            else:
+                # Fall back to tools/list as health probe
+                resp = await client.post(
+                    self._url,
+                    content=_HEALTH_BODY,
+                    headers=_JSON_HEADERS,
+                    timeout=_HEALTH_TIMEOUT,
+                )
+                resp.raise_for_status()
+                latency_ms = (time.monotonic_ns() - start) // 1_000_000
+                return {"ok": True, "latency_ms": latency_ms}
 
         except Exception as e:
-            latency_ms = round((time.time() - start) * 1000)
+            latency_ms = (time.monotonic_ns() - start) // 1_000_000
             return {"ok": False, "latency_ms": latency_ms, "error": str(e)}
@@ -5,32 +5,66 @@ Spawns a child process and communicates via MCP SDK's stdio transport.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from contextlib import AsyncExitStack
-from typing import Any
+from typing import Any, Callable, Sequence
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import ImageContent, TextContent
 
-from .base import BackendConnection, BackendState, BackendToolInfo
+from .base import BackendConnection, BackendState, BackendToolInfo, intern_schema
 
 logger = logging.getLogger("mcp_0ne.backends.stdio")
 
+# Content block type -> dict converter for the common MCP SDK block types
+_BLOCK_CONVERTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    TextContent: lambda b: {"type": "text", "text": b.text},
+    ImageContent: lambda b: {"type": b.type, "data": b.data},
+}
+
+
+def _block_to_dict(block: Any) -> dict[str, Any]:
+    """Convert an MCP SDK content block to its dict form."""
+    convert = _BLOCK_CONVERTERS.get(type(block))
+    if convert is not None:
+        return convert(block)
+    # Less common block types: fall back to duck typing
+    if hasattr(block, "text"):
+        return {"type": "text", "text": block.text}
+    if hasattr(block, "data"):
+        return {"type": block.type, "data": block.data}
+    return {"type": "text", "text": str(block)}
+
 
 class StdioBackend(BackendConnection):
     """Backend that spawns a subprocess and talks MCP over stdio."""
 
+    __slots__ = (
+        "_command",
+        "_args",
+        "_env",
+        "_timeout",
+        "_runner",
+        "_stop",
+        "_session",
+        "_tool_cache_ttl_ns",
+        "_tools_cache_time_ns",
+    )
+
     def __init__(self, id: str, config: dict[str, Any], separator: str = "__"):
         super().__init__(id=id, config=config, prefix=config["prefix"], separator=separator)
         self._command: str = config["command"]
         self._args: list[str] = config.get("args", [])
         self._env: dict[str, str] | None = config.get("env")
         self._timeout: float = float(config.get("timeout", 60))
-        self._exit_stack: AsyncExitStack | None = None
+        self._runner: asyncio.Task[None] | None = None
+        self._stop: asyncio.Event | None = None
         self._session: ClientSession | None = None
-        self._tool_cache_ttl: float = float(config.get("tool_cache_ttl", 60))
-        self._tools_cache_time: float = 0
+        self._tool_cache_ttl_ns: int = int(float(config.get("tool_cache_ttl", 60)) * 1_000_000_000)
+        self._tools_cache_time_ns: int = 0
 
     async def connect(self) -> None:
         """Spawn the subprocess and establish MCP session."""
@@ -43,16 +77,10 @@ class StdioBackend(BackendConnection):
                 env=self._env,
             )
 
-            self._exit_stack = AsyncExitStack()
-            stdio_transport = await self._exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read_stream, write_stream = stdio_transport
-            self._session = await self._exit_stack.enter_async_context(
-                ClientSession(read_stream, write_stream)
-            )
-
-            await self._session.initialize()
+            self._stop = asyncio.Event()
+            ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+            self._runner = asyncio.create_task(self._run_session(server_params, self._stop, ready))
+            self._session = await ready
 
             self.state = BackendState.CONNECTED
             logger.info(f"[{self.id}] Stdio backend connected: {self._command} {' '.join(self._args)}")
@@ -64,46 +92,82 @@ class StdioBackend(BackendConnection):
             await self._cleanup()
             raise
 
+    async def _run_session(
+        self,
+        server_params: StdioServerParameters,
+        stop: asyncio.Event,
+        ready: asyncio.Future[ClientSession],
+    ) -> None:
+        """Own the subprocess transport and session until ``stop`` is set.
+
+        The SDK contexts hold anyio cancel scopes, which must be exited by the
+        task that entered them. Running them in a dedicated task lets connect()
+        and disconnect() be awaited from any task, including concurrently.
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                read_stream, write_stream = await stack.enter_async_context(
+                    stdio_client(server_params)
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                await session.initialize()
+                ready.set_result(session)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"[{self.id}] Cleanup warning: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+
     async def _cleanup(self) -> None:
-        """Clean up exit stack and session."""
-        if self._exit_stack:
+        """Stop the session task and wait for the subprocess to exit."""
+        if self._runner:
+            self._stop.set()
             try:
-                await self._exit_stack.aclose()
+                await self._runner
             except Exception as e:
                 logger.warning(f"[{self.id}] Cleanup warning: {e}")
-            self._exit_stack = None
+            self._runner = None
+            self._stop = None
         self._session = None
 
     async def disconnect(self) -> None:
         """Kill the subprocess and clean up."""
         await self._cleanup()
         self.state = BackendState.DISCONNECTED
-        self._tools = []
-        self._tools_cache_time = 0
+        self._tools = ()
+        self._tools_cache_time_ns = 0
         logger.info(f"[{self.id}] Disconnected")
 
-    async def list_tools(self) -> list[BackendToolInfo]:
+    async def list_tools(self) -> Sequence[BackendToolInfo]:
         """Enumerate tools from the stdio backend."""
         if not self._session:
             raise RuntimeError(f"Backend '{self.id}' not connected")
 
-        now = time.time()
-        if self._tools and (now - self._tools_cache_time) < self._tool_cache_ttl:
+        now = time.monotonic_ns()
+        if self._tools and (now - self._tools_cache_time_ns) < self._tool_cache_ttl_ns:
             return self._tools
 
         try:
             result = await self._session.list_tools()
-            self._tools = [
+            pfx = self._tool_prefix
+            schemas: dict[bytes, dict[str, Any]] = {}
+            self._tools = tuple(
                 BackendToolInfo(
                     original_name=t.name,
-                    namespaced_name=self._namespace(t.name),
+                    namespaced_name=pfx + t.name,
                     description=t.description or "",
-                    input_schema=t.inputSchema if hasattr(t, "inputSchema") else {},
+                    input_schema=intern_schema(t.inputSchema if hasattr(t, "inputSchema") else {}, schemas),
                     backend_id=self.id,
                 )
                 for t in result.tools
-            ]
-            self._tools_cache_time = now
+            )
+            self._tools_cache_time_ns = now
             logger.info(f"[{self.id}] Enumerated {len(self._tools)} tools")
             return self._tools
 
@@ -124,17 +188,8 @@ class StdioBackend(BackendConnection):
         try:
             result = await self._session.call_tool(original_name, arguments)
             # Convert MCP SDK result to dict format
-            content = []
-            for block in result.content:
-                if hasattr(block, "text"):
-                    content.append({"type": "text", "text": block.text})
-                elif hasattr(block, "data"):
-                    content.append({"type": block.type, "data": block.data})
-                else:
-                    content.append({"type": "text", "text": str(block)})
-
             return {
-                "content": content,
+                "content": [_block_to_dict(block) for block in result.content],
                 "isError": getattr(result, "isError", False),
             }
         except Exception as e:
@@ -145,14 +200,14 @@ class StdioBackend(BackendConnection):
 
     async def health_check(self) -> dict[str, Any]:
         """Check health by verifying session is alive."""
-        start = time.time()
+        start = time.monotonic_ns()
         if not self._session:
             return {"ok": False, "latency_ms": 0, "error": "Not connected"}
 
         try:
             await self._session.list_tools()
-            latency_ms = round((time.time() - start) * 1000)
+            latency_ms = (time.monotonic_ns() - start) // 1_000_000
             return {"ok": True, "latency_ms": latency_ms}
         except Exception as e:
-            latency_ms = round((time.time() - start) * 1000)
+            latency_ms = (time.monotonic_ns() - start) // 1_000_000
             return {"ok": False, "latency_ms": latency_ms, "error": str(e)}
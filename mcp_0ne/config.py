@@ -5,12 +5,15 @@ Loads/saves backends.json and reads environment variable overrides.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import stat
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger("mcp_0ne.config")
 
 # Environment variable overrides
@@ -28,6 +31,7 @@ DEFAULT_SETTINGS = {
     "lazy_connect": True,
     "tool_cache_ttl": 60,
     "log_level": "info",
+    "watch_config": True,
 }
 
 
@@ -41,28 +45,69 @@ def load_config() -> dict[str, Any]:
         return {"backends": {}, "settings": dict(DEFAULT_SETTINGS)}
 
     try:
-        data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        data = orjson.loads(CONFIG_PATH.read_bytes())
         # Merge defaults for any missing settings
-        settings = dict(DEFAULT_SETTINGS)
-        settings.update(data.get("settings", {}))
-        data["settings"] = settings
-        if "backends" not in data:
-            data["backends"] = {}
+        data["settings"] = {**DEFAULT_SETTINGS, **data.get("settings", {})}
+        data.setdefault("backends", {})
         return data
-    except (json.JSONDecodeError, OSError) as e:
+    except (orjson.JSONDecodeError, OSError) as e:
         logger.error(f"Failed to load config: {e}")
         return {"backends": {}, "settings": dict(DEFAULT_SETTINGS)}
 
 
+def parse_config(raw: bytes) -> dict[str, Any]:
+    """Decode backends.json content and merge default settings.
+
+    Unlike load_config(), never falls back to defaults: raises ValueError
+    unless the content is a JSON object with a "backends" mapping.
+    """
+    data = orjson.loads(raw)  # orjson.JSONDecodeError is a ValueError
+    if not isinstance(data, dict) or not isinstance(data.get("backends"), dict):
+        raise ValueError('expected a JSON object with a "backends" mapping')
+    data["settings"] = {**DEFAULT_SETTINGS, **data.get("settings", {})}
+    return data
+
+
+def encode_config(data: dict[str, Any]) -> bytes:
+    """Serialize config in the backends.json on-disk format."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+
+
 def save_config(data: dict[str, Any]) -> None:
     """Save config to backends.json."""
+    write_config(encode_config(data))
+
+
+def write_config(payload: bytes) -> None:
+    """Write already-encoded config to backends.json.
+
+    Safe to run in a worker thread, since it never touches the live config dict.
+    The file is replaced atomically, so readers never see a partial write.
+    Failures are logged, not raised: saves run in the background.
+    """
+    # Write through a symlinked backends.json rather than replacing the link
+    target = CONFIG_PATH.resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
     try:
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        CONFIG_PATH.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Keep the original permissions; the file can hold secrets in stdio env
+            mode = stat.S_IMODE(target.stat().st_mode)
+        except FileNotFoundError:
+            mode = None
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        try:
+            os.replace(tmp_path, target)
+        except PermissionError:
+            # Windows won't replace a file another process has open; write in place
+            target.write_bytes(payload)
+            tmp_path.unlink()
         logger.info(f"Config saved to {CONFIG_PATH}")
     except OSError as e:
         logger.error(f"Failed to save config: {e}")
-        raise
+        with suppress(OSError):
+            tmp_path.unlink()
@@ -6,7 +6,7 @@ with all backend tools, and routing calls to the correct destination.
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from typing import Any
 
 from .admin_tools import get_admin_tool_definitions, handle_admin_tool
@@ -14,13 +14,15 @@ from .registry import BackendRegistry
 
 MCP_PROTOCOL_VERSION = "2024-11-05"
 
+# Admin tools are static for the life of the process
+_ADMIN_TOOLS = tuple(get_admin_tool_definitions())
+
 
 class GatewayProtocol:
     """Async JSON-RPC 2.0 MCP protocol handler for the gateway."""
 
     def __init__(self, registry: BackendRegistry):
         self.registry = registry
-        self._sessions: dict[str, bool] = {}
 
     async def handle_request(
         self,
@@ -28,42 +30,32 @@ class GatewayProtocol:
         session_id: str | None = None,
     ) -> tuple[dict[str, Any], str]:
         """Handle a JSON-RPC 2.0 request. Returns (response, session_id)."""
-        req_id = request.get("id")
-        method = request.get("method", "")
-        params = request.get("params", {})
-
-        if request.get("jsonrpc") != "2.0":
+        get = request.get
+        req_id = get("id")
+        if get("jsonrpc") != "2.0":
             return self._error(req_id, -32600, "Invalid Request: missing jsonrpc 2.0"), session_id or ""
 
-        # Ensure session
+        # Sessions are stateless: any request is served, so only mint an id
         if not session_id:
-            session_id = f"session_{uuid.uuid4().hex}"
-        if session_id not in self._sessions:
-            self._sessions[session_id] = False
-
-        if method == "initialize":
-            self._sessions[session_id] = True
-            return self._success(req_id, {
-                "protocolVersion": MCP_PROTOCOL_VERSION,
-                "capabilities": {"tools": {"listChanged": False}},
-                "serverInfo": {"name": "mcp-0ne", "version": "0.1.0"},
-            }), session_id
-
-        # Auto-initialize for stateless clients
-        if not self._sessions.get(session_id):
-            self._sessions[session_id] = True
-
-        if method == "tools/list":
-            return await self._handle_tools_list(req_id), session_id
-
-        if method == "tools/call":
-            return await self._handle_tools_call(req_id, params), session_id
-
-        return self._error(req_id, -32601, f"Method not found: {method}"), session_id
-
-    async def _handle_tools_list(self, req_id: Any) -> dict[str, Any]:
+            session_id = "session_" + secrets.token_hex(16)
+
+        method = get("method", "")
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is None:
+            return self._error(req_id, -32601, f"Method not found: {method}"), session_id
+        return await handler(self, req_id, get("params", {})), session_id
+
+    async def _handle_initialize(self, req_id: Any, params: dict[str, Any]) -> dict[str, Any]:
+        """Return server capabilities."""
+        return self._success(req_id, {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {"name": "mcp-0ne", "version": "0.1.0"},
+        })
+
+    async def _handle_tools_list(self, req_id: Any, params: dict[str, Any]) -> dict[str, Any]:
         """Merge admin tools + all backend tools."""
-        tools = list(get_admin_tool_definitions())
+        tools = list(_ADMIN_TOOLS)
         tools.extend(self.registry.list_all_tools())
         return self._success(req_id, {"tools": tools})
 
@@ -89,3 +81,11 @@ class GatewayProtocol:
 
     def _error(self, req_id: Any, code: int, message: str) -> dict[str, Any]:
         return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+# JSON-RPC method -> handler, each called as handler(protocol, req_id, params)
+_METHOD_HANDLERS = {
+    "initialize": GatewayProtocol._handle_initialize,
+    "tools/list": GatewayProtocol._handle_tools_list,
+    "tools/call": GatewayProtocol._handle_tools_call,
+}
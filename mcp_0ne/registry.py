@@ -6,16 +6,24 @@ maintaining the unified tool map, and routing tool calls.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from pathlib import Path
+from typing import Any, Sequence
+
+import orjson
+from watchfiles import awatch
 
 from .backends.base import BackendConnection, BackendState, BackendToolInfo
 from .backends.http_backend import HttpBackend
 from .backends.stdio_backend import StdioBackend
-from .config import load_config, save_config
+from .config import CONFIG_PATH, encode_config, load_config, parse_config, write_config
 
 logger = logging.getLogger("mcp_0ne.registry")
 
+# Seconds to wait before writing backends.json, so bursts of changes share one write
+PERSIST_DELAY = 0.1
+
 
 class BackendRegistry:
     """Manages all backend connections and the merged tool catalog."""
@@ -24,7 +32,21 @@ class BackendRegistry:
         self._backends: dict[str, BackendConnection] = {}
         self._tool_map: dict[str, tuple[BackendConnection, str]] = {}
         # namespaced_name -> (backend, original_name)
+        self._backend_keys: dict[str, set[str]] = {}
+        # backend_id -> namespaced names it owns in _tool_map
+        self._prefixes: dict[str, str] = {}
+        # prefix -> backend_id, for O(1) uniqueness checks
+        self._connected: dict[str, BackendConnection] = {}
+        # backends with indexed tools; connect order varies, so never iterate it for output
         self._config: dict[str, Any] = {}
+        # Bumped whenever the tool map changes; keys the list_all_tools cache
+        self._catalog_version = 0
+        self._catalog_cache: tuple[tuple[Any, ...], list[dict[str, Any]]] | None = None
+        self._persist_handle: asyncio.TimerHandle | None = None
+        self._write_tasks: set[asyncio.Task[None]] = set()
+        self._write_lock = asyncio.Lock()
+        # Bytes of our own most recent config write, so the watcher can skip it
+        self._last_written: bytes | None = None
 
     @property
     def separator(self) -> str:
@@ -47,9 +69,12 @@ class BackendRegistry:
     async def load_from_config(self) -> dict[str, Any]:
         """Load all backends from backends.json and optionally connect."""
         self._config = load_config()
+        lazy = self.lazy_connect
         results = {}
+        to_connect: list[BackendConnection] = []
 
-        for backend_id, backend_config in self._config.get("backends", {}).items():
+        # load_config() guarantees a "backends" mapping
+        for backend_id, backend_config in self._config["backends"].items():
             if not backend_config.get("enabled", True):
                 results[backend_id] = "disabled"
                 continue
@@ -57,69 +82,276 @@ class BackendRegistry:
             try:
                 backend = self._create_backend(backend_id, backend_config)
                 self._backends[backend_id] = backend
+                self._prefixes[backend.prefix] = backend_id
 
-                if not self.lazy_connect:
-                    await backend.connect()
-                    tools = await backend.list_tools()
-                    self._index_tools(backend, tools)
-                    results[backend_id] = f"connected ({len(tools)} tools)"
-                else:
+                if lazy:
                     results[backend_id] = "registered (lazy)"
+                else:
+                    # Placeholder keeps config order; replaced once connected below
+                    results[backend_id] = "connecting"
+                    to_connect.append(backend)
             except Exception as e:
                 results[backend_id] = f"error: {e}"
                 logger.error(f"Failed to load backend '{backend_id}': {e}")
 
+        async def connect_one(backend: BackendConnection) -> str:
+            try:
+                return f"connected ({await self._connect_and_index(backend)} tools)"
+            except Exception as e:
+                logger.error(f"Failed to load backend '{backend.id}': {e}")
+                return f"error: {e}"
+
+        # Connect eagerly-loaded backends concurrently
+        outcomes = await asyncio.gather(*[connect_one(backend) for backend in to_connect])
+        results.update(zip((backend.id for backend in to_connect), outcomes))
         return results
 
-    def _index_tools(self, backend: BackendConnection, tools: list[BackendToolInfo]) -> None:
+    async def _connect_and_index(self, backend: BackendConnection) -> int:
+        """Connect a backend, enumerate and index its tools. Returns the tool count."""
+        await backend.connect()
+        tools = await backend.list_tools()
+        self._index_tools(backend, tools)
+        return len(tools)
+
+    def _index_tools(self, backend: BackendConnection, tools: Sequence[BackendToolInfo]) -> None:
         """Index tools from a backend into the merged tool map."""
         # Remove old entries for this backend
-        self._tool_map = {
-            k: v for k, v in self._tool_map.items() if v[0].id != backend.id
-        }
+        self._unindex_backend(backend.id)
         # Add new entries
+        keys = set()
         for tool in tools:
             self._tool_map[tool.namespaced_name] = (backend, tool.original_name)
+            keys.add(tool.namespaced_name)
+        self._backend_keys[backend.id] = keys
+        self._connected[backend.id] = backend
+        backend._tool_dicts = [
+            {"name": t.namespaced_name, "description": t.description, "inputSchema": t.input_schema}
+            for t in tools
+        ]
+        self._catalog_version += 1
 
     def _unindex_backend(self, backend_id: str) -> None:
         """Remove all tool map entries for a backend."""
-        self._tool_map = {
-            k: v for k, v in self._tool_map.items() if v[0].id != backend_id
-        }
+        tool_map = self._tool_map
+        for name in self._backend_keys.pop(backend_id, ()):
+            # Namespaced names can collide; leave entries another backend has since taken
+            entry = tool_map.get(name)
+            if entry is not None and entry[0].id == backend_id:
+                del tool_map[name]
+        self._connected.pop(backend_id, None)
+        backend = self._backends.get(backend_id)
+        if backend is not None:
+            backend._tool_dicts = []
+        self._catalog_version += 1
 
     async def ensure_all_connected(self) -> None:
         """Connect all lazy backends that aren't connected yet."""
-        for backend in self._backends.values():
-            if backend.enabled and backend.state != BackendState.CONNECTED:
-                try:
-                    await backend.connect()
-                    tools = await backend.list_tools()
-                    self._index_tools(backend, tools)
-                except Exception as e:
-                    logger.warning(f"Failed to connect backend '{backend.id}': {e}")
+        async def connect_one(backend: BackendConnection) -> None:
+            try:
+                await self._connect_and_index(backend)
+            except Exception as e:
+                logger.warning(f"Failed to connect backend '{backend.id}': {e}")
+
+        await asyncio.gather(*[
+            connect_one(backend)
+            for backend in self._backends.values()
+            if backend.enabled and backend.state != BackendState.CONNECTED
+        ])
 
     def _persist(self) -> None:
+        """Schedule a save of backend configs to backends.json.
+
+        Calls within PERSIST_DELAY of each other are coalesced into one write.
+        """
+        if self._persist_handle is None:
+            self._persist_handle = asyncio.get_running_loop().call_later(PERSIST_DELAY, self._start_write)
+
+    def _start_write(self) -> None:
+        self._persist_handle = None
+        task = asyncio.create_task(self._write_config())
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _write_config(self) -> None:
         """Save current backend configs to backends.json."""
-        self._config["backends"] = {
-            bid: b.config for bid, b in self._backends.items()
+        # Encode on the loop so the worker thread gets a consistent snapshot
+        try:
+            payload = encode_config(self._config)
+        except orjson.JSONEncodeError as e:
+            # e.g. a non-str key or an int beyond 64 bits; nobody awaits this task
+            logger.error(f"Failed to encode config, not saved: {e}")
+            return
+        # Writes hit the disk in the order they were encoded
+        async with self._write_lock:
+            # The watcher reads under this lock too, so it sees both or neither
+            self._last_written = payload
+            await asyncio.to_thread(write_config, payload)
+
+    async def flush_config(self) -> None:
+        """Write a pending config save immediately, e.g. before shutdown."""
+        if self._persist_handle is not None:
+            self._persist_handle.cancel()
+            self._persist_handle = None
+            await self._write_config()
+        if self._write_tasks:
+            await asyncio.gather(*self._write_tasks)
+
+    @property
+    def watch_enabled(self) -> bool:
+        return self._config.get("settings", {}).get("watch_config", True)
+
+    async def watch_config(self) -> None:
+        """Apply external edits to backends.json until cancelled.
+
+        Watches the parent directory so editors that save by atomic
+        replace (write temp file + rename) are picked up too. Failures
+        are logged rather than raised, so shutdown can always await it.
+        """
+        try:
+            CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            async for changes in awatch(CONFIG_PATH.parent, recursive=False):
+                if not any(Path(path).name == CONFIG_PATH.name for _, path in changes):
+                    continue
+                try:
+                    await self._apply_config_file()
+                except Exception:
+                    logger.exception("Failed to apply config change")
+        except Exception:
+            logger.exception("Config watcher stopped")
+
+    async def _apply_config_file(self) -> None:
+        """Reconcile the registry with backends.json after it changed on disk."""
+        # Read under the write lock: mid-save, the file still holds our previous
+        # payload, which would look like an external edit and revert the last change
+        async with self._write_lock:
+            try:
+                raw = CONFIG_PATH.read_bytes()
+            except OSError:
+                return  # deleted or mid-replace; the next event picks it up
+            if raw == self._last_written:
+                return  # our own write
+        try:
+            new_config = parse_config(raw)
+        except ValueError as e:
+            # Half-saved or invalid; applying defaults would drop every backend
+            logger.warning(f"Ignoring invalid config change: {e}")
+            return
+        results = await self.diff_apply(new_config)
+        for backend_id, status in results.items():
+            logger.info(f"Config change [{backend_id}] {status}")
+        # Same as startup: lazily registered backends are connected before use
+        await self.ensure_all_connected()
+
+    async def diff_apply(self, new_config: dict[str, Any]) -> dict[str, str]:
+        """Bring the registry in line with an edited config.
+
+        Only backends whose config changed are touched: added, removed,
+        enabled/disabled, or recreated when connection settings changed.
+        The edited config is adopted as-is and never written back, so
+        entries that fail to apply stay in the file for the user to fix.
+        """
+        old_backends = self._config.get("backends", {})
+        new_backends = new_config["backends"]
+        self._config["settings"] = new_config["settings"]
+        self._config["backends"] = new_backends
+        connect = not self.lazy_connect
+        results: dict[str, str] = {}
+
+        for backend_id in old_backends:
+            if backend_id in new_backends:
+                continue
+            try:
+                if backend_id in self._backends:
+                    await self._drop_backend(backend_id)
+                results[backend_id] = "removed"
+            except Exception as e:
+                results[backend_id] = f"error: {e}"
+                logger.error(f"Failed to remove backend '{backend_id}': {e}")
+
+        for backend_id, config in new_backends.items():
+            old = old_backends.get(backend_id)
+            if old == config:
+                # Keep the dict the live backend already shares
+                new_backends[backend_id] = old
+                continue
+            try:
+                results[backend_id] = await self._apply_backend_config(backend_id, old, config, connect)
+            except Exception as e:
+                results[backend_id] = f"error: {e}"
+                logger.error(f"Failed to apply config for backend '{backend_id}': {e}")
+
+        # Recreated and added backends go in at the end; restore file order for tools/list
+        self._backends = {
+            backend_id: self._backends[backend_id] for backend_id in new_backends if backend_id in self._backends
         }
-        save_config(self._config)
+        return results
 
-    async def add_backend(self, backend_id: str, config: dict[str, Any], connect: bool = True) -> dict[str, Any]:
-        """Register a new backend. Optionally connect and enumerate tools."""
-        if backend_id in self._backends:
-            raise ValueError(f"Backend '{backend_id}' already exists")
+    async def _apply_backend_config(
+        self,
+        backend_id: str,
+        old: dict[str, Any] | None,
+        config: dict[str, Any],
+        connect: bool,
+    ) -> str:
+        """Apply one backend's edited config without saving. Returns a status."""
+        backend = self._backends.get(backend_id)
 
-        # Validate prefix uniqueness
+        if backend is not None and _without_enabled(old) == _without_enabled(config):
+            backend.config = config
+            backend.refresh_cached_config()
+            if not backend.enabled:
+                if backend.state == BackendState.CONNECTED:
+                    await backend.disconnect()
+                self._unindex_backend(backend_id)
+                return "disabled"
+            if connect:
+                await self._connect_and_index(backend)
+            return "enabled"
+
+        # Validate before touching the running backend, so a bad edit leaves it up
+        new_backend = self._build_backend(backend_id, config)
+        status = "added"
+        if backend is not None:
+            await self._drop_backend(backend_id)
+            status = "updated"
+        self._backends[backend_id] = new_backend
+        self._prefixes[new_backend.prefix] = backend_id
+
+        if connect and new_backend.enabled:
+            return f"{status}, connected ({await self._connect_and_index(new_backend)} tools)"
+        return status
+
+    def _build_backend(self, backend_id: str, config: dict[str, Any]) -> BackendConnection:
+        """Validate a backend config and create its connection, without registering it."""
         new_prefix = config.get("prefix", "")
         if not new_prefix:
             raise ValueError("prefix is required")
-        for existing in self._backends.values():
-            if existing.prefix == new_prefix:
-                raise ValueError(f"Prefix '{new_prefix}' already in use by backend '{existing.id}'")
+        owner = self._prefixes.get(new_prefix)
+        if owner is not None and owner != backend_id:
+            raise ValueError(f"Prefix '{new_prefix}' already in use by backend '{owner}'")
+        return self._create_backend(backend_id, config)
+
+    async def _drop_backend(self, backend_id: str) -> BackendConnection:
+        """Disconnect and unregister a backend, leaving its config alone."""
+        backend = self._backends[backend_id]
+        if backend.state == BackendState.CONNECTED:
+            await backend.disconnect()
+
+        self._unindex_backend(backend_id)
+        del self._backends[backend_id]
+        self._prefixes.pop(backend.prefix, None)
+        return backend
+
+    async def add_backend(self, backend_id: str, config: dict[str, Any], connect: bool = True) -> dict[str, Any]:
+        """Register a new backend. Optionally connect and enumerate tools."""
+        if backend_id in self._backends:
+            raise ValueError(f"Backend '{backend_id}' already exists")
 
-        backend = self._create_backend(backend_id, config)
+        backend = self._build_backend(backend_id, config)
         self._backends[backend_id] = backend
+        self._prefixes[backend.prefix] = backend_id
+        # Backends share their config dict with self._config, so saves need no rebuild
+        self._config.setdefault("backends", {})[backend_id] = config
 
         result: dict[str, Any] = {"id": backend_id, "state": "registered"}
 
@@ -139,15 +371,11 @@ class BackendRegistry:
 
     async def remove_backend(self, backend_id: str) -> dict[str, Any]:
         """Disconnect and remove a backend."""
-        backend = self._backends.get(backend_id)
-        if not backend:
+        if backend_id not in self._backends:
             raise ValueError(f"Backend '{backend_id}' not found")
 
-        if backend.state == BackendState.CONNECTED:
-            await backend.disconnect()
-
-        self._unindex_backend(backend_id)
-        del self._backends[backend_id]
+        await self._drop_backend(backend_id)
+        self._config["backends"].pop(backend_id, None)
         self._persist()
         return {"id": backend_id, "removed": True}
 
@@ -158,6 +386,7 @@ class BackendRegistry:
             raise ValueError(f"Backend '{backend_id}' not found")
 
         backend.config["enabled"] = True
+        backend.refresh_cached_config()
         try:
             await backend.connect()
             tools = await backend.list_tools()
@@ -178,47 +407,66 @@ class BackendRegistry:
             await backend.disconnect()
 
         backend.config["enabled"] = False
+        backend.refresh_cached_config()
         self._unindex_backend(backend_id)
         self._persist()
         return {"id": backend_id, "enabled": False}
 
+    def update_backend_config(self, backend_id: str, updates: dict[str, Any]) -> BackendConnection:
+        """Apply config changes to a backend in place and save them."""
+        backend = self._backends.get(backend_id)
+        if not backend:
+            raise ValueError(f"Backend '{backend_id}' not found")
+
+        backend.config.update(updates)
+        backend.refresh_cached_config()
+        # "enabled" decides whether the backend's tools are listed
+        self._catalog_version += 1
+        self._persist()
+        return backend
+
     async def refresh(self, backend_id: str | None = None) -> dict[str, Any]:
         """Reconnect and re-enumerate tools for one or all backends."""
-        targets = (
-            [self._backends[backend_id]] if backend_id else list(self._backends.values())
-        )
-        if backend_id and backend_id not in self._backends:
-            raise ValueError(f"Backend '{backend_id}' not found")
+        if backend_id:
+            backend = self._backends.get(backend_id)
+            if backend is None:
+                raise ValueError(f"Backend '{backend_id}' not found")
+            targets: tuple[BackendConnection, ...] = (backend,)
+        else:
+            targets = tuple(self._backends.values())
 
-        results = {}
-        for backend in targets:
-            if not backend.enabled:
-                results[backend.id] = "disabled"
-                continue
-            try:
-                if backend.state == BackendState.CONNECTED:
-                    await backend.disconnect()
-                await backend.connect()
-                tools = await backend.list_tools()
-                self._index_tools(backend, tools)
-                results[backend.id] = f"refreshed ({len(tools)} tools)"
-            except Exception as e:
-                results[backend.id] = f"error: {e}"
+        outcomes = await asyncio.gather(*[self._refresh_one(backend) for backend in targets])
+        return {backend.id: outcome for backend, outcome in zip(targets, outcomes)}
 
-        return results
+    async def _refresh_one(self, backend: BackendConnection) -> str:
+        """Reconnect a single backend and re-index its tools. Returns a status string."""
+        if not backend.enabled:
+            return "disabled"
+        try:
+            if backend.state == BackendState.CONNECTED:
+                await backend.disconnect()
+            return f"refreshed ({await self._connect_and_index(backend)} tools)"
+        except Exception as e:
+            return f"error: {e}"
 
     def list_all_tools(self) -> list[dict[str, Any]]:
-        """Return merged list of all namespaced tools from all connected backends."""
+        """Return merged list of all namespaced tools from all connected backends.
+
+        The list is cached until the catalog or a backend's state changes,
+        and is shared between callers — treat it as read-only.
+        """
+        # Backends can drop to ERROR on their own, so their states are part of the key
+        key = (self._catalog_version, *(b.state for b in self._connected.values()))
+        if self._catalog_cache is not None and self._catalog_cache[0] == key:
+            return self._catalog_cache[1]
+
         tools = []
-        for backend in self._backends.values():
-            if backend.state != BackendState.CONNECTED or not backend.enabled:
-                continue
-            for tool in backend._tools:
-                tools.append({
-                    "name": tool.namespaced_name,
-                    "description": tool.description,
-                    "inputSchema": tool.input_schema,
-                })
+        # Walk _backends so tools/list follows config order, not connect order
+        connected = self._connected
+        for backend_id, backend in self._backends.items():
+            if backend_id in connected and backend.state == BackendState.CONNECTED and backend.enabled:
+                tools.extend(backend._tool_dicts)
+        self._catalog_cache = (key, tools)
         return tools
 
     def resolve_tool(self, namespaced_name: str) -> tuple[BackendConnection, str] | None:
@@ -256,3 +504,7 @@ class BackendRegistry:
 
     def get_backend(self, backend_id: str) -> BackendConnection | None:
         return self._backends.get(backend_id)
+
+
+def _without_enabled(config: dict[str, Any] | None) -> dict[str, Any]:
+    return {k: v for k, v in (config or {}).items() if k != "enabled"}
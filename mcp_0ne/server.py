@@ -6,8 +6,10 @@ mounts the REST API, and exposes SSE + JSON-RPC MCP endpoints.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any, Sequence
 
 from fastapi import FastAPI, Request, Response
@@ -19,6 +21,7 @@ from starlette.routing import Route
 from starlette.types import Receive, Scope, Send
 
 from . import __version__
+from .admin_tools import get_admin_tool_definitions, handle_admin_tool
 from .api import router as api_router, set_registry
 from .config import HOST, PORT, LOG_LEVEL
 from .protocol import GatewayProtocol
@@ -33,6 +36,13 @@ protocol = GatewayProtocol(registry)
 # ── MCP SDK Server (streamable HTTP transport) ─────────────────────
 mcp_server = McpServer("mcp-0ne")
 
+# Admin tools never change, so their Tool models are built once
+_ADMIN_TOOLS = tuple(Tool(**t) for t in get_admin_tool_definitions())
+
+# (backend tool list it was built from, admin + backend Tool models).
+# list_all_tools() returns the same list object until the catalog changes.
+_tools_cache: tuple[list[dict[str, Any]], list[Tool]] | None = None
+
 
 @mcp_server.list_tools()
 async def _mcp_list_tools() -> list[Tool]:
@@ -41,28 +51,39 @@ async def _mcp_list_tools() -> list[Tool]:
     # Calling ensure_all_connected() inside an MCP handler breaks anyio
     # cancel scopes because ClientSession.__aenter__ pushes cancel scopes
     # that outlive the request handler's responder scope.
-    from .admin_tools import get_admin_tool_definitions
-    raw_tools = list(get_admin_tool_definitions()) + list(registry.list_all_tools())
-    return [Tool(**t) for t in raw_tools]
+    global _tools_cache
+    backend_tools = registry.list_all_tools()
+    if _tools_cache is None or _tools_cache[0] is not backend_tools:
+        tools = list(_ADMIN_TOOLS)
+        tools.extend(Tool(**t) for t in backend_tools)
+        _tools_cache = (backend_tools, tools)
+    return _tools_cache[1]
+
+
+def _to_text_content(content: list[dict[str, Any]]) -> list[TextContent]:
+    """Convert MCP content dicts to TextContent, JSON-encoding non-text blocks."""
+    out = []
+    for c in content:
+        text = c.get("text")
+        if text is None:
+            text = json.dumps(c)
+        out.append(TextContent(type="text", text=text))
+    return out
 
 
 @mcp_server.call_tool()
 async def _mcp_call_tool(name: str, arguments: dict[str, Any] | None = None) -> Sequence[TextContent]:
     """Route tool calls through the gateway protocol."""
-    import json
-    from .admin_tools import handle_admin_tool
     arguments = arguments or {}
 
     # Try admin tools first
     admin_result = await handle_admin_tool(name, arguments, registry)
     if admin_result is not None:
-        content = admin_result.get("content", [])
-        return [TextContent(type="text", text=c.get("text", json.dumps(c))) for c in content]
+        return _to_text_content(admin_result.get("content", []))
 
     # Route to backend
     result = await registry.call_tool(name, arguments)
-    content = result.get("content", [])
-    return [TextContent(type="text", text=c.get("text", json.dumps(c))) for c in content]
+    return _to_text_content(result.get("content", []))
 
 
 # ── Session manager — handles transport lifecycle via SDK ──────────
@@ -87,10 +108,19 @@ async def lifespan(app: FastAPI):
     await registry.ensure_all_connected()
     logger.info(f"mcp-0ne ready — {len(registry.list_all_tools())} tools from {len(registry.list_backends())} backends")
 
+    # Pick up external edits to backends.json without a restart
+    watcher = asyncio.create_task(registry.watch_config()) if registry.watch_enabled else None
+
     async with session_manager.run():
         yield
 
     logger.info("mcp-0ne shutting down...")
+    if watcher:
+        watcher.cancel()
+        # watch_config logs its own failures; never let them skip cleanup
+        with suppress(asyncio.CancelledError, Exception):
+            await watcher
+    await registry.flush_config()
     for info in registry.list_backends():
         backend = registry.get_backend(info["id"])
         if backend and backend.state.value == "connected":
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from contextlib import suppress
 
 from mcp.server.stdio import stdio_server
 
@@ -30,9 +31,18 @@ async def main() -> None:
     for backend_id, status in results.items():
         logging.getLogger("mcp_0ne").info(f"  [{backend_id}] {status}")
     await registry.ensure_all_connected()
-
-    async with stdio_server() as (read_stream, write_stream):
-        await mcp_server.run(read_stream, write_stream, mcp_server.create_initialization_options())
+    watcher = asyncio.create_task(registry.watch_config()) if registry.watch_enabled else None
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp_server.run(read_stream, write_stream, mcp_server.create_initialization_options())
+    finally:
+        if watcher:
+            watcher.cancel()
+            # watch_config logs its own failures; never let them skip cleanup
+            with suppress(asyncio.CancelledError, Exception):
+                await watcher
+        await registry.flush_config()
 
 
 if __name__ == "__main__":